@@ -14,10 +14,17 @@ Usage example:
         --fuzzbench-dir ~/dev/fuzzbench
 """
 
+import os
 import re
 import sys
+import stat
+import shutil
+import fcntl
+import socket
+import struct
 import textwrap
 import argparse
+import ipaddress
 import subprocess
 
 from pathlib import Path
@@ -47,20 +54,62 @@ def parse_args() -> argparse.Namespace:
 
 
 # --------------------------------------------------------------------- utilities
+SIOCGIFADDR = 0x8915  # from <linux/sockios.h>
+_INET_RE = re.compile(rb"inet (\d+\.\d+\.\d+\.\d+)")
+
+
 def get_global_ipv4() -> list[str]:
-    """Return a list of global‑scope IPv4 addresses on this host."""
+    """
+    Return a list of global‑scope IPv4 addresses on this host.
+
+    `ip -4 addr show scope global` is the source of truth, as it lists every
+    address including secondaries; the in‑process ioctl lookup is only used
+    on hosts without `ip`.
+    """
+    if shutil.which("ip"):
+        return _ipv4_from_ip_command()
+    try:
+        return _ipv4_from_interfaces()
+    except OSError:
+        return []
+
+
+def _ipv4_from_interfaces() -> list[str]:
+    """
+    Ask the kernel for each interface's address in‑process (Linux only).
+
+    SIOCGIFADDR yields one address per interface, the primary one, so
+    secondary addresses are missed; hence this is only a fallback.
+    """
+    addrs = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for _, name in socket.if_nameindex():
+            req = struct.pack("256s", name.encode()[:15])
+            try:
+                res = fcntl.ioctl(s.fileno(), SIOCGIFADDR, req)
+            except OSError:
+                continue  # interface is down or has no IPv4 address
+            ip = ipaddress.IPv4Address(res[20:24])
+            if not (ip.is_loopback or ip.is_link_local):
+                addrs.append(str(ip))
+    return addrs
+
+
+def _ipv4_from_ip_command() -> list[str]:
+    """Parse `ip -4 addr show scope global`."""
     out = subprocess.run(
         ["ip", "-4", "addr", "show", "scope", "global"],
-        capture_output=True, text=True, check=False
+        capture_output=True, check=False
     ).stdout
-    return re.findall(r"inet (\d+\.\d+\.\d+\.\d+)", out)
+    return [ip.decode() for ip in _INET_RE.findall(out)]
 
 
 # -------------------------------------------------------------------------- main
 def main() -> None:
     args = parse_args()
 
-    # Resolve important paths
+    # Resolve important paths once; everything below is derived from these
+    # absolute paths, so no further resolve() calls are needed
     script_dir      = Path(__file__).resolve().parent
     fuzzbench_dir   = Path(args.fuzzbench_dir).expanduser().resolve()
     exp_dir         = script_dir / args.exp_name
@@ -71,7 +120,11 @@ def main() -> None:
     config_path     = exp_dir / "config.yaml"
 
     # Sanity check – make sure run_experiment.py exists where the user pointed us
-    if not (fuzzbench_dir / "experiment" / "run_experiment.py").is_file():
+    try:
+        st = os.stat(fuzzbench_dir / "experiment" / "run_experiment.py")
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         sys.exit(f"Error: {fuzzbench_dir} does not look like a FuzzBench checkout")
 
     # ------------------------------------------------------------------ skeleton
@@ -93,7 +146,7 @@ def main() -> None:
     # --------------------------- run.sh ------------------------------------
     cmd_parts = [
         "PYTHONPATH=. python3 experiment/run_experiment.py",
-        f"--experiment-config {config_path.resolve()}",
+        f"--experiment-config {config_path}",
         f"--experiment-name {args.exp_name}",
         "--benchmarks " + " ".join(args.benchmarks),
         "--fuzzers "    + " ".join(args.fuzzers),
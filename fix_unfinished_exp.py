@@ -1,198 +1,477 @@
 #!/usr/bin/env python3
 import argparse
+import contextlib
 import csv
-import gzip
+import io
+import json
+import os
 from pathlib import Path
-import shutil
 import sys
-import tempfile
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
 from collections import Counter, defaultdict
-import statistics
+import math
+
+import numpy as np
+
+try:  # optional: parallel gzip decompression for large inputs
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+try:  # optional: ISA-L / zlib-ng backed drop-ins for the gzip module
+    from isal import igzip as gzip
+except ImportError:
+    try:
+        from zlib_ng import gzip_ng as gzip
+    except ImportError:
+        import gzip
+
+try:  # optional: multithreaded C++ CSV parsing and decompression
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+# group_by(use_threads=False) and the hash "first" aggregate need pyarrow 13+
+PYARROW_MIN_MAJOR = 13
+if pa is not None and int(pa.__version__.split(".")[0]) < PYARROW_MIN_MAJOR:
+    pa = None
 
 # -------------------- IO helpers --------------------
 
-def decompress_gzip(src: Path, out_dir: Path) -> Path:
-    """Decompress a .gzip/.gz file into out_dir and return the decompressed CSV path."""
-    out_dir.mkdir(parents=True, exist_ok=True)
-    stem = src.name[:-len(src.suffix)] if src.suffix else (src.name + ".csv")
-    dst = out_dir / stem
-    with gzip.open(src, "rb") as fin, open(dst, "wb") as fout:
-        shutil.copyfileobj(fin, fout)
-    return dst
-
-def resolve_csv_path(maybe_gz: Path, out_dir: Path) -> Path:
-    """Return a CSV path; gunzip into out_dir if needed (unique per input!)."""
-    if maybe_gz.suffix.lower() in {".gz", ".gzip"}:
-        return decompress_gzip(maybe_gz, out_dir)
-    return maybe_gz
-
-def read_csv_rows(csv_path: Path):
-    with open(csv_path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        return rows, reader.fieldnames or []
-
-def write_csv_rows(rows: List[dict], fieldnames: List[str], out_path: Path) -> None:
+# Larger reads mean fewer Python <-> zlib round trips than gzip's 8 KiB default
+READ_BUFFER_SIZE = 128 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+# Below this (compressed) size, spinning up rapidgzip's thread pool costs more than it saves
+PARALLEL_GZIP_MIN_SIZE = 32 * 1024 * 1024
+
+def _is_gzip(path: Path) -> bool:
+    return path.suffix.lower() in {".gz", ".gzip"}
+
+def open_csv_stream(csv_path: Path) -> Tuple[contextlib.ExitStack, Iterator[List[str]]]:
+    """
+    Open a CSV or .gz/.gzip for streaming. Returns (closer, reader); use the
+    closer in a `with` block to release every underlying handle.
+    """
+    stack = contextlib.ExitStack()
+    if _is_gzip(csv_path):
+        if rapidgzip is not None and csv_path.stat().st_size >= PARALLEL_GZIP_MIN_SIZE:
+            gz = rapidgzip.open(str(csv_path), parallelization=os.cpu_count() or 1)
+        else:
+            # The decompressor pulls small chunks (8 KiB for gzip before 3.12)
+            # from its source; a 128 KiB-buffered file turns most into memcpys
+            src = stack.enter_context(open(csv_path, "rb", buffering=READ_BUFFER_SIZE))
+            gz = gzip.open(src, "rb")
+        raw = io.BufferedReader(gz, buffer_size=READ_BUFFER_SIZE)
+        fh = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    else:
+        fh = open(csv_path, "r", newline="", encoding="utf-8", buffering=READ_BUFFER_SIZE)
+    stack.enter_context(fh)
+    return stack, csv.reader(fh)
+
+def _arrow_read_header(csv_path: Path) -> List[str]:
+    fh, reader = open_csv_stream(csv_path)
+    with fh:
+        header = next(reader, [])
+    _check_header(header)
+    return header
+
+def _arrow_read(csv_path: Path, columns: List[str]) -> "pa.Table":
+    compression = "gzip" if _is_gzip(csv_path) else None
+    with pa.input_stream(str(csv_path), compression=compression, buffer_size=READ_BUFFER_SIZE) as src:
+        return pacsv.read_csv(
+            src,
+            read_options=pacsv.ReadOptions(block_size=8 << 20),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            # Read as text and cast after; columns not summarised are skipped
+            convert_options=pacsv.ConvertOptions(
+                include_columns=columns,
+                column_types={n: pa.string() for n in columns},
+            ),
+        )
+
+def _arrow_int(tbl: "pa.Table", name: str) -> "pa.ChunkedArray":
+    # Raises pa.ArrowInvalid on anything that isn't a plain decimal integer
+    return pc.cast(tbl[name], pa.int64())
+
+def _check_header(header: List[str]) -> None:
+    for name in ("trial_id", "time"):
+        if name not in header:
+            raise SystemExit(f"CSV is missing a valid '{name}' column.")
+
+def write_csv_rows(rows: Iterable[List[str]], header: List[str], out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+    with open(out_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def col_idx(header: List[str]) -> Dict[str, int]:
+    """Column name -> position, resolved once per file."""
+    return {name: i for i, name in enumerate(header)}
+
+def _project(rows: Iterable[List[str]], src_header: List[str], dst_header: List[str]) -> Iterator[List[str]]:
+    """Reorder positional *rows* from src_header to dst_header, filling gaps with ""."""
+    n = len(dst_header)
+    if list(src_header) == list(dst_header):
+        # Same layout (the common case): pass rows through, padding short ones
+        for row in rows:
+            yield row if len(row) == n else (row + [""] * (n - len(row)))[:n]
+        return
+    pos = col_idx(src_header)
+    idx = [pos.get(name, -1) for name in dst_header]
+    for row in rows:
+        yield [row[i] if 0 <= i < len(row) else "" for i in idx]
 
 # -------------------- Core logic for data.csv fix --------------------
 
-def group_by_trial(rows: List[dict]) -> Dict[int, List[dict]]:
-    by_tid: Dict[int, List[dict]] = {}
-    for r in rows:
-        try:
-            tid = int(r["trial_id"])
-        except Exception:
-            raise SystemExit("CSV is missing a valid 'trial_id' column.")
-        by_tid.setdefault(tid, []).append(r)
-    return by_tid
+TrialMeta = Dict[int, Tuple[str, str, int]]  # tid -> (fuzzer, benchmark, max_time)
+FbIndex = Dict[Tuple[str, str], List[Tuple[int, int]]]  # (fuzzer, benchmark) -> [(max_time, tid), ...]
+
+SUMMARY_SUFFIX = ".summary.json"  # per-CSV cache written by summarize_trials
+SUMMARY_VERSION = 1  # bump whenever what a summary holds or how it is computed changes
 
-def max_time_for_trial(trial_rows: List[dict]) -> int:
-    mt = -1
-    for r in trial_rows:
+class TrialSummary(NamedTuple):
+    """Per-trial summary of a data CSV; no rows are retained."""
+    path: Path
+    header: List[str]
+    meta: TrialMeta
+
+def summarize_trials(csv_path: Path) -> TrialSummary:
+    """
+    Summarise every trial in *csv_path* without keeping its rows. The result is
+    cached in a <csv>.summary.json sidecar, reused while the CSV's size and
+    mtime are unchanged.
+    """
+    try:
+        st = csv_path.stat()
+        stamp = [st.st_size, st.st_mtime_ns]
+    except OSError:
+        stamp = None
+    summary = _load_summary(csv_path, stamp)
+    if summary is None:
+        if pa is not None:
+            try:
+                summary = _summarize_trials_arrow(csv_path)
+            except (pa.ArrowException, TypeError):
+                # Arrow is stricter than csv.reader/int() (ragged rows, padded
+                # numbers) and its API varies by release; let the streaming
+                # path accept or reject the file
+                summary = _summarize_trials_stream(csv_path)
+        else:
+            summary = _summarize_trials_stream(csv_path)
+        _save_summary(summary, stamp)
+    return summary
+
+def _summary_sidecar(csv_path: Path) -> Path:
+    return csv_path.with_name(csv_path.name + SUMMARY_SUFFIX)
+
+def _load_summary(csv_path: Path, stamp: Optional[List[int]]) -> Optional[TrialSummary]:
+    if stamp is None:
+        return None
+    try:
+        with open(_summary_sidecar(csv_path), encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["version"] != SUMMARY_VERSION or cached["stamp"] != stamp:
+            return None
+        header, raw_meta = cached["header"], cached["meta"]
+        if not (isinstance(header, list) and all(isinstance(h, str) for h in header)):
+            return None
+        if not isinstance(raw_meta, dict):
+            return None
+        intern = sys.intern
+        meta: TrialMeta = {
+            int(tid): (intern(fz), intern(bm), int(mt)) for tid, (fz, bm, mt) in raw_meta.items()
+        }
+        return TrialSummary(csv_path, header, meta)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing, unreadable, stale or hand-edited cache: just summarise again
+        return None
+
+def _save_summary(summary: TrialSummary, stamp: Optional[List[int]]) -> None:
+    if stamp is None:
+        return
+    cached = {"version": SUMMARY_VERSION, "stamp": stamp, "header": summary.header, "meta": summary.meta}
+    try:
+        with open(_summary_sidecar(summary.path), "w", encoding="utf-8") as f:
+            json.dump(cached, f)
+    except OSError:
+        pass  # best effort: e.g. a read-only data dir
+
+def _summarize_trials_arrow(csv_path: Path) -> TrialSummary:
+    # One hash group-by in Arrow instead of a Python pass over the rows
+    header = _arrow_read_header(csv_path)
+    tbl = _arrow_read(csv_path, [n for n in header if n in REQUIRED_COLUMNS])
+    cols = {"trial_id": _arrow_int(tbl, "trial_id"), "time": _arrow_int(tbl, "time")}
+    for name in ("fuzzer", "benchmark"):
+        if name in header:
+            # Blank cells become null so "first" skips them, as the streaming path does
+            col = tbl[name]
+            cols[name] = pc.if_else(pc.equal(col, ""), pa.scalar(None, pa.string()), col)
+        else:
+            cols[name] = pa.nulls(tbl.num_rows, pa.string())
+    agg = (
+        pa.table(cols)
+        # "first" needs the ordered (single-threaded) group-by
+        .group_by("trial_id", use_threads=False)
+        .aggregate([("time", "max"), ("fuzzer", "first"), ("benchmark", "first")])
+    )
+    intern = sys.intern
+    meta: TrialMeta = {
+        tid: (intern(f or ""), intern(b or ""), mt)
+        for tid, mt, f, b in zip(
+            agg["trial_id"].to_pylist(),
+            agg["time_max"].to_pylist(),
+            agg["fuzzer_first"].to_pylist(),
+            agg["benchmark_first"].to_pylist(),
+        )
+    }
+    return TrialSummary(csv_path, header, meta)
+
+def _summarize_trials_stream(csv_path: Path) -> TrialSummary:
+    # Single streaming pass; keyed by the raw trial_id text so int() runs
+    # once per trial rather than once per row
+    acc: Dict[str, list] = {}  # trial_id text -> [max_time, fuzzer, benchmark]
+    fh, reader = open_csv_stream(csv_path)
+    with fh:
+        header = next(reader, [])
+        _check_header(header)
+        col = col_idx(header)
+        tid_i, time_i = col["trial_id"], col["time"]
+        fuzzer_i, bench_i = col.get("fuzzer"), col.get("benchmark")
+        intern = sys.intern
         try:
-            t = int(r["time"])
-        except Exception:
+            for row in reader:
+                if not row:
+                    continue
+                t = int(row[time_i])
+                a = acc.get(row[tid_i])
+                if a is None:
+                    acc[row[tid_i]] = [
+                        t,
+                        intern(row[fuzzer_i]) if fuzzer_i is not None else "",
+                        intern(row[bench_i]) if bench_i is not None else "",
+                    ]
+                    continue
+                if t > a[0]:
+                    a[0] = t
+                if not a[1] and fuzzer_i is not None:
+                    a[1] = intern(row[fuzzer_i])
+                if not a[2] and bench_i is not None:
+                    a[2] = intern(row[bench_i])
+        except ValueError:
             raise SystemExit("CSV is missing a valid 'time' column.")
-        if t > mt:
-            mt = t
-    return mt
+        except IndexError:
+            raise SystemExit(f"{csv_path}: line {reader.line_num} has fewer fields than the header.")
 
-def _mode(values: List[str]) -> str:
-    values = [v for v in values if v]
-    return Counter(values).most_common(1)[0][0] if values else ""
+    meta: TrialMeta = {}
+    for tid_s, (mt, f, b) in acc.items():
+        try:
+            tid = int(tid_s)
+        except ValueError:
+            raise SystemExit("CSV is missing a valid 'trial_id' column.")
+        if tid in meta:  # same id spelled differently, e.g. "7" and "07"
+            pf, pb, pmt = meta[tid]
+            f, b, mt = pf or f, pb or b, max(pmt, mt)
+        meta[tid] = (f, b, mt)
+    return TrialSummary(csv_path, header, meta)
 
-def fuzzer_bench_for_trial(trial_rows: List[dict]) -> Tuple[str, str]:
-    fuzzer = _mode([r.get("fuzzer", "") for r in trial_rows])
-    bench  = _mode([r.get("benchmark", "") for r in trial_rows])
-    return fuzzer, bench
+REQUIRED_COLUMNS = ("trial_id", "time", "fuzzer", "benchmark")
 
 def union_headers(a: List[str], b: List[str]) -> List[str]:
-    seen, merged = set(), []
-    for name in (a or []):
-        if name not in seen:
-            merged.append(name); seen.add(name)
-    for name in (b or []):
-        if name not in seen:
-            merged.append(name); seen.add(name)
-    return merged
-
-def list_unfinished_trials(un_rows: List[dict], trial_time: int) -> List[Tuple[int, str, str, int]]:
-    un_by_tid = group_by_trial(un_rows)
-    unfinished = []
-    for tid, trows in un_by_tid.items():
-        mt = max_time_for_trial(trows)
-        if mt < trial_time:
-            f, b = fuzzer_bench_for_trial(trows)
-            unfinished.append((tid, f, b, mt))
-    return sorted(unfinished, key=lambda x: x[0])
+    """Order-preserving union of both headers plus any missing REQUIRED_COLUMNS."""
+    return list(dict.fromkeys([*(a or []), *(b or []), *REQUIRED_COLUMNS]))
+
+def index_by_fuzzer_benchmark(meta: TrialMeta) -> FbIndex:
+    """(fuzzer, benchmark) -> [(max_time, tid), ...], longest-running first."""
+    by_fb: FbIndex = defaultdict(list)
+    for tid, (f, b, mt) in meta.items():
+        by_fb[(f, b)].append((mt, tid))
+    for bucket in by_fb.values():
+        bucket.sort(key=lambda x: x[0], reverse=True)
+    return by_fb
+
+def list_unfinished_trials(meta: TrialMeta, trial_time: int) -> List[Tuple[int, str, str, int]]:
+    # Classify all trials with one array compare; tuples are built only for the hits
+    n = len(meta)
+    tids = np.fromiter(meta.keys(), dtype=np.int64, count=n)
+    max_times = np.fromiter((mt for _, _, mt in meta.values()), dtype=np.int64, count=n)
+    unfinished = np.sort(tids[max_times < trial_time])
+    return [(tid, *meta[tid]) for tid in unfinished.tolist()]
 
 def find_unique_finished_candidate_by_fb(
-    sub_by_tid: Dict[int, List[dict]],
+    sub_by_fb: FbIndex,
     trial_time: int,
     target_fb: Tuple[str, str],
     allow_incomplete: bool
-) -> Tuple[int, List[dict]]:
-    candidates: List[Tuple[int, List[dict], int]] = []
-    for tid, trows in sub_by_tid.items():
-        fb = fuzzer_bench_for_trial(trows)
-        if fb == target_fb:
-            mt = max_time_for_trial(trows)
-            if allow_incomplete or mt >= trial_time:
-                candidates.append((tid, trows, mt))
-
-    if not candidates:
+) -> int:
+    # Buckets are sorted by max_time (desc), so the best candidate and the only
+    # one that could tie with it (or also be finished) are the first two.
+    bucket = sub_by_fb.get(target_fb, [])
+    if not bucket or not (allow_incomplete or bucket[0][0] >= trial_time):
         raise SystemExit(
             f"No {'suitable' if allow_incomplete else 'finished'} substitute found for "
             f"fuzzer={target_fb[0]}, benchmark={target_fb[1]}"
         )
+    best_time, best_tid = bucket[0]
+    runner_up = bucket[1][0] if len(bucket) > 1 else None
     if allow_incomplete:
-        candidates.sort(key=lambda x: x[2], reverse=True)
-        best_tid, best_rows, best_time = candidates[0]
-        ties = [tid for tid, _, mt in candidates if mt == best_time and tid != best_tid]
-        if ties:
+        if runner_up == best_time:
             raise SystemExit(
                 f"Multiple substitute candidates with the same best time ({best_time}) for "
                 f"fuzzer={target_fb[0]}, benchmark={target_fb[1]}; ambiguous which to use."
             )
-        return best_tid, best_rows
+        return best_tid
 
-    if len(candidates) > 1:
+    if runner_up is not None and runner_up >= trial_time:
         raise SystemExit(
             f"Multiple finished substitutes found for fuzzer={target_fb[0]}, benchmark={target_fb[1]}; "
             "ambiguous which to use."
         )
-    tid, rows, _ = candidates[0]
-    return tid, rows
+    return best_tid
 
 def substitute_trials(
-    unfinished_rows: List[dict],
-    substitute_rows: List[dict],
+    un: TrialSummary,
+    sub: TrialSummary,
+    header: List[str],
     trial_time: int,
     verbose: bool,
     allow_incomplete: bool,
-) -> Tuple[List[dict], List[int], List[Tuple[int, str, str, int]]]:
+) -> Tuple[Iterator[List[str]], List[int], List[Tuple[int, str, str, int]]]:
     """
     Substitute ONLY by (fuzzer, benchmark). Exact trial_id matches are ignored.
-    Returns (new_rows, substituted_dest_tids, plan) where plan entries are
+    Returns (new_rows, substituted_dest_tids, plan) where new_rows lazily yields
+    output rows laid out according to *header* and plan entries are
     (dest_tid, fuzzer, benchmark, src_tid).
     """
-    un_by_tid = group_by_trial(unfinished_rows)
-    sub_by_tid = group_by_trial(substitute_rows)
+    # Only substitutes are looked up by (fuzzer, benchmark), so only they get the index
+    sub_by_fb = index_by_fuzzer_benchmark(sub.meta)
 
-    unfinished_meta = list_unfinished_trials(unfinished_rows, trial_time)
+    unfinished_meta = list_unfinished_trials(un.meta, trial_time)
     if verbose:
         print("Unfinished trials detected (tid, fuzzer, benchmark, max_time):")
         for tid, f, b, mt in unfinished_meta:
             print(f"  {tid}, {f}, {b}, {mt}")
 
     unfinished_tids = [tid for tid, _, _, _ in unfinished_meta]
-    mapping: Dict[int, Tuple[int, List[dict]]] = {}
+    mapping: Dict[int, int] = {}  # dest_tid -> src_tid
     plan: List[Tuple[int, str, str, int]] = []
 
     for dest_tid, f, b, _ in unfinished_meta:
-        sub_tid, sub_rows = find_unique_finished_candidate_by_fb(
-            sub_by_tid, trial_time, (f, b), allow_incomplete
+        sub_tid = find_unique_finished_candidate_by_fb(
+            sub_by_fb, trial_time, (f, b), allow_incomplete
         )
-        mapping[dest_tid] = (sub_tid, sub_rows)
+        mapping[dest_tid] = sub_tid
         plan.append((dest_tid, f, b, sub_tid))
         if verbose:
-            mt = max_time_for_trial(sub_rows)
+            mt = sub.meta[sub_tid][2]
             print(f"  -> using substitute by (fuzzer,bench) ({f}, {b}): sub_tid={sub_tid}, mt={mt}")
 
-    # Build output: keep all non-unfinished; replace unfinished with mapped rows (rewrite trial_id)
-    new_rows: List[dict] = []
-    unfinished_tid_set = set(unfinished_tids)
-    for r in unfinished_rows:
-        tid = int(r["trial_id"])
-        if tid not in unfinished_tid_set:
-            new_rows.append(r)
-
-    for dest_tid, (src_tid, src_rows) in mapping.items():
-        for r in src_rows:
-            nr = dict(r)
-            nr["trial_id"] = str(dest_tid)  # always rewrite to destination id
-            new_rows.append(nr)
-
-    return new_rows, unfinished_tids, plan
+    # Output: keep all non-unfinished; replace unfinished with mapped rows (rewrite trial_id)
+    return _iter_fixed_rows(un, sub, header, unfinished_tids, mapping), unfinished_tids, plan
+
+def _iter_fixed_rows(
+    un: TrialSummary,
+    sub: TrialSummary,
+    header: List[str],
+    drop_tids: List[int],
+    mapping: Dict[int, int],
+) -> Iterator[List[str]]:
+    yield from _project(_iter_kept_rows(un, drop_tids), un.header, header)
+    yield from _project(_iter_substitute_rows(sub, mapping), sub.header, header)
+
+def _iter_kept_rows(un: TrialSummary, drop_tids: List[int]) -> Iterator[List[str]]:
+    """Stream *un*'s CSV from disk again, skipping rows of trials in *drop_tids*."""
+    drop = set(drop_tids)
+    tid_i = un.header.index("trial_id")
+    # Decided once per distinct trial_id text, not int()-parsed on every row
+    keep: Dict[str, bool] = {}
+    fh, reader = open_csv_stream(un.path)
+    with fh:
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            tid_s = row[tid_i]
+            k = keep.get(tid_s)
+            if k is None:
+                k = keep[tid_s] = int(tid_s) not in drop
+            if k:
+                yield row
+
+def _iter_substitute_rows(sub: TrialSummary, mapping: Dict[int, int]) -> Iterator[List[str]]:
+    """
+    Stream *sub*'s CSV, keeping only rows of the chosen source trials, then
+    emit them once per destination with trial_id rewritten.
+    """
+    tid_i = sub.header.index("trial_id")
+    picked: Dict[int, List[List[str]]] = {src_tid: [] for src_tid in mapping.values()}
+    if picked:
+        by_text: Dict[str, Optional[List[List[str]]]] = {}  # trial_id text -> picked list
+        fh, reader = open_csv_stream(sub.path)
+        with fh:
+            next(reader, None)
+            for row in reader:
+                if not row:
+                    continue
+                tid_s = row[tid_i]
+                if tid_s in by_text:
+                    rows = by_text[tid_s]
+                else:
+                    rows = by_text[tid_s] = picked.get(int(tid_s))
+                if rows is not None:
+                    rows.append(row)
+    uses = Counter(mapping.values())
+    for dest_tid, src_tid in mapping.items():
+        dest = str(dest_tid)  # always rewrite to destination id
+        # A substitute used for a single destination is patched in place;
+        # only shared ones need a copy per destination.
+        shared = uses[src_tid] > 1
+        for row in picked[src_tid]:
+            r = list(row) if shared else row
+            r[tid_i] = dest
+            yield r
 
 # -------------------- Throughput CSV helpers --------------------
 
-SpeedTrialMap = Dict[int, Tuple[float, Optional[float]]]
+class SpeedTrialMap(NamedTuple):
+    """
+    Per-trial throughput of one (benchmark, fuzzer), as parallel arrays sorted
+    by tid. A missing speed or run time is NaN.
+    """
+    tids: np.ndarray    # int64, sorted, unique
+    speeds: np.ndarray  # float64
+    times: np.ndarray   # float64
+
 SpeedResults = Dict[Tuple[str, str], SpeedTrialMap]  # key=(benchmark,fuzzer)
 
+def _last_of_each(tids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted unique *tids* and, for each, the index of its last occurrence."""
+    # np.unique reports first occurrences, so look at the entries back to front
+    uniq, rev_idx = np.unique(tids[::-1], return_index=True)
+    return uniq, tids.size - 1 - rev_idx
+
+def _merge_trials(
+    tmap: Optional[SpeedTrialMap], tids: np.ndarray, speeds: np.ndarray, times: np.ndarray
+) -> SpeedTrialMap:
+    """Add (or replace) trials in *tmap*; for a repeated tid the last entry wins."""
+    if tmap is not None:
+        tids = np.concatenate([tmap.tids, tids])
+        speeds = np.concatenate([tmap.speeds, speeds])
+        times = np.concatenate([tmap.times, times])
+    uniq, idx = _last_of_each(tids)
+    return SpeedTrialMap(uniq, speeds[idx], times[idx])
+
+def _trial_pos(tmap: SpeedTrialMap, tid: int) -> Optional[int]:
+    i = int(np.searchsorted(tmap.tids, tid))
+    return i if i < tmap.tids.size and tmap.tids[i] == tid else None
+
 def read_speeds_csv(csv_path: Path) -> SpeedResults:
     """
     Parse throughput CSV. Requires 'trials' with 'tid:val' pairs (new format).
     Optionally parses 'trial_times' (tid:seconds).
     """
-    res: SpeedResults = defaultdict(dict)
+    res: SpeedResults = {}
     with csv_path.open(newline="", encoding="utf-8") as f:
         rdr = csv.DictReader(f)
         fields = rdr.fieldnames or []
@@ -209,24 +488,41 @@ def read_speeds_csv(csv_path: Path) -> SpeedResults:
                     f"{csv_path}: 'trials' for ({bench},{fuzz}) lacks trial IDs. "
                     "Regenerate speeds CSV with trial_id mapping (new format)."
                 )
-            # parse speeds
-            for item in trials_str.split():
-                tid_s, val_s = item.split(":", 1)
-                res[key][int(tid_s)] = (float(val_s), None)
+            # parse speeds; a trial listed again replaces the earlier entry
+            tids, vals = _parse_pairs(trials_str, csv_path, "trials")
+            tmap = _merge_trials(res.get(key), tids, vals, np.full(tids.size, np.nan))
             # parse times if present
             if has_times:
                 times_str = (row.get("trial_times") or "").strip()
                 if times_str:
-                    for item in times_str.split():
-                        tid_s, t_s = item.split(":", 1)
-                        tid = int(tid_s)
-                        if tid in res[key]:
-                            spd, _ = res[key][tid]
-                            res[key][tid] = (spd, float(t_s))
-                        else:
-                            res[key][tid] = (float("nan"), float(t_s))
+                    tids, secs = _parse_pairs(times_str, csv_path, "trial_times")
+                    # times for known trials are filled in; unknown ones get a NaN speed
+                    tids, idx = _last_of_each(tids)
+                    secs = secs[idx]
+                    pos = np.searchsorted(tmap.tids, tids)
+                    known = pos < tmap.tids.size
+                    known[known] = tmap.tids[pos[known]] == tids[known]
+                    tmap.times[pos[known]] = secs[known]
+                    new = ~known
+                    if new.any():
+                        tmap = _merge_trials(tmap, tids[new], np.full(int(new.sum()), np.nan), secs[new])
+            res[key] = tmap
     return res
 
+def _parse_pairs(field: str, csv_path: Path, column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a space-separated 'tid:value' field into (int64 tids, float64 values).
+    Each half goes through one NumPy conversion instead of per-item int()/float().
+    """
+    flat = field.replace(":", " ").split()
+    if len(flat) == 2 * len(field.split()):
+        try:
+            # str -> int64 follows int(): "7.0" or "1e1" are not trial ids
+            return np.array(flat[0::2]).astype(np.int64), np.array(flat[1::2], dtype=np.float64)
+        except (ValueError, OverflowError):
+            pass
+    raise SystemExit(f"{csv_path}: malformed '{column}' field (expected 'tid:value' pairs): {field!r}")
+
 def write_speeds_csv(res: SpeedResults, out_path: Path) -> None:
     """
     Write a throughput CSV with recalculated mean/stdev from the trial_map.
@@ -246,19 +542,22 @@ def write_speeds_csv(res: SpeedResults, out_path: Path) -> None:
         w.writerow(["benchmark", "fuzzer", "mean", "stdev", "num_trials", "trials", "trial_times"])
         for bench in benches:
             for fuzz in by_bench[bench]:
-                tmap = res.get((bench, fuzz), {})
-                vals = [v for (v, _t) in tmap.values() if not _is_nan(v)]
-                mean = statistics.mean(vals) if vals else float("nan")
-                stdev = statistics.stdev(vals) if len(vals) > 1 else 0.0
-                trials_field = " ".join(f"{tid}:{v:.2f}" for tid, (v, _t) in sorted(tmap.items()))
-                times_field = " ".join(f"{tid}:{int(t)}" for tid, (_v, t) in sorted(tmap.items()) if t is not None)
-                w.writerow([bench, fuzz, _fmt_num(mean), f"{stdev:.2f}", len(tmap), trials_field, times_field])
-
-def _is_nan(x: float) -> bool:
-    return x != x  # NaN check
-
-def _fmt_num(x: float) -> str:
-    return "nan" if _is_nan(x) else f"{x:.2f}"
+                tmap = res[(bench, fuzz)]
+                mean, stdev = _mean_stdev(tmap.speeds[~np.isnan(tmap.speeds)])
+                # tids are kept sorted, so fields come out in trial order as-is
+                tids = tmap.tids.tolist()
+                trials_field = " ".join([f"{tid}:{v:.2f}" for tid, v in zip(tids, tmap.speeds.tolist())])
+                times_field = " ".join([
+                    f"{tid}:{int(t)}" for tid, t in zip(tids, tmap.times.tolist()) if not math.isnan(t)
+                ])
+                w.writerow([bench, fuzz, f"{mean:.2f}", f"{stdev:.2f}", len(tids), trials_field, times_field])
+
+def _mean_stdev(vals: np.ndarray) -> Tuple[float, float]:
+    """Mean and sample stdev (nan / 0.0 for too few values)."""
+    if not vals.size:
+        return float("nan"), 0.0
+    mean = float(vals.mean())
+    return mean, float(vals.std(ddof=1)) if vals.size > 1 else 0.0
 
 def apply_substitution_plan_to_speeds(
     speeds_unfinished: SpeedResults,
@@ -275,18 +574,23 @@ def apply_substitution_plan_to_speeds(
         key = (bench, fuzzer)
         if key not in speeds_substitute:
             raise SystemExit(f"Substitute speeds CSV missing ({bench}, {fuzzer}) needed for trial {dest_tid}")
-        if src_tid not in speeds_substitute[key]:
+        src = speeds_substitute[key]
+        i = _trial_pos(src, src_tid)
+        if i is None:
             raise SystemExit(
                 f"Substitute speeds CSV missing src trial_id={src_tid} for ({bench}, {fuzzer})"
             )
-        src_val = speeds_substitute[key][src_tid]
-        # ensure dest map exists
-        if key not in speeds_unfinished:
-            speeds_unfinished[key] = {}
-        speeds_unfinished[key][dest_tid] = src_val
+        spd, rt = float(src.speeds[i]), float(src.times[i])
+        dest = speeds_unfinished.get(key)
+        j = _trial_pos(dest, dest_tid) if dest is not None else None
+        if j is not None:
+            dest.speeds[j], dest.times[j] = spd, rt
+        else:
+            speeds_unfinished[key] = _merge_trials(
+                dest, np.array([dest_tid], np.int64), np.array([spd]), np.array([rt])
+            )
         if verbose:
-            spd, rt = src_val
-            rt_s = f", time={int(rt)}s" if rt is not None else ""
+            rt_s = f", time={int(rt)}s" if not math.isnan(rt) else ""
             print(f"  [throughput] ({bench},{fuzzer}) dest_tid={dest_tid} <- src_tid={src_tid} speed={spd:.2f}{rt_s}")
     return speeds_unfinished
 
@@ -327,6 +631,9 @@ def main(argv=None):
         raise SystemExit(f"File not found: {unfinished}")
     if not substitute.exists():
         raise SystemExit(f"File not found: {substitute}")
+    # Inputs are re-read while the output is written, so they must not be the same file
+    if out_data.exists() and any(out_data.samefile(p) for p in (unfinished, substitute)):
+        raise SystemExit(f"Output {out_data} would overwrite an input CSV.")
 
     # If any throughput flag is given, require all three
     use_speeds = any([args.unfinished_throughput_csv, args.substitute_throughput_csv, args.output_throughput_csv])
@@ -334,56 +641,42 @@ def main(argv=None):
         raise SystemExit("If using throughput CSVs, you must provide --unfinished-speeds-csv, "
                          "--substitute-speeds-csv, and --output-throughput-csv.")
 
-    with tempfile.TemporaryDirectory() as tmp:
-        tmpdir = Path(tmp)
-        # Separate subdirs to avoid filename collisions like data.csv.gz -> data.csv
-        un_csv  = resolve_csv_path(unfinished,  tmpdir / "unfinished")
-        sub_csv = resolve_csv_path(substitute,  tmpdir / "substitute")
-
-        # Guard against accidental collisions
-        try:
-            if un_csv.resolve() == sub_csv.resolve():
-                raise SystemExit("Internal error: both CSV paths resolved to the same file; check gzip extraction.")
-        except FileNotFoundError:
-            pass
+    # Both CSVs are re-streamed when writing, so only per-trial summaries are held
+    un = summarize_trials(unfinished)
+    sub = summarize_trials(substitute)
 
-        un_rows, un_hdr = read_csv_rows(un_csv)
-        sub_rows, sub_hdr = read_csv_rows(sub_csv)
+    hdr = union_headers(un.header, sub.header)
 
-        fixed_rows, swapped_tids, plan = substitute_trials(
-            un_rows, sub_rows, args.trial_time, args.verbose, args.allow_incomplete_substitute
-        )
-        hdr = union_headers(un_hdr, sub_hdr)
-        for req in ("trial_id", "time", "fuzzer", "benchmark"):
-            if req not in hdr:
-                hdr.append(req)
+    fixed_rows, swapped_tids, plan = substitute_trials(
+        un, sub, hdr, args.trial_time, args.verbose, args.allow_incomplete_substitute
+    )
 
-        write_csv_rows(fixed_rows, hdr, out_data)
+    write_csv_rows(fixed_rows, hdr, out_data)
 
-        if swapped_tids:
-            print("Substituted trials:", ", ".join(str(t) for t in sorted(swapped_tids)))
-        else:
-            print("No unfinished trials detected; wrote a copy to output.")
+    if swapped_tids:
+        print("Substituted trials:", ", ".join(str(t) for t in sorted(swapped_tids)))
+    else:
+        print("No unfinished trials detected; wrote a copy to output.")
 
-        # If requested, also patch throughput CSV
-        if use_speeds:
-            unfinished_speeds_path = Path(args.unfinished_throughput_csv)
-            substitute_speeds_path = Path(args.substitute_throughput_csv)
-            out_speeds_path = Path(args.output_throughput_csv)
+    # If requested, also patch throughput CSV
+    if use_speeds:
+        unfinished_speeds_path = Path(args.unfinished_throughput_csv)
+        substitute_speeds_path = Path(args.substitute_throughput_csv)
+        out_speeds_path = Path(args.output_throughput_csv)
 
-            if not unfinished_speeds_path.exists():
-                raise SystemExit(f"File not found: {unfinished_speeds_path}")
-            if not substitute_speeds_path.exists():
-                raise SystemExit(f"File not found: {substitute_speeds_path}")
+        if not unfinished_speeds_path.exists():
+            raise SystemExit(f"File not found: {unfinished_speeds_path}")
+        if not substitute_speeds_path.exists():
+            raise SystemExit(f"File not found: {substitute_speeds_path}")
 
-            speeds_unfinished = read_speeds_csv(unfinished_speeds_path)
-            speeds_substitute = read_speeds_csv(substitute_speeds_path)
+        speeds_unfinished = read_speeds_csv(unfinished_speeds_path)
+        speeds_substitute = read_speeds_csv(substitute_speeds_path)
 
-            merged = apply_substitution_plan_to_speeds(
-                speeds_unfinished, speeds_substitute, plan, args.verbose
-            )
-            write_speeds_csv(merged, out_speeds_path)
-            print(f"Throughput CSV written to {out_speeds_path}")
+        merged = apply_substitution_plan_to_speeds(
+            speeds_unfinished, speeds_substitute, plan, args.verbose
+        )
+        write_speeds_csv(merged, out_speeds_path)
+        print(f"Throughput CSV written to {out_speeds_path}")
 
 if __name__ == "__main__":
     main()
@@ -18,12 +18,14 @@ Render a chart from an existing CSV (no need for the experiments folder)::
 
 from __future__ import annotations
 
+import os
 import sys
 import tarfile
 import argparse
-import statistics
 import csv
+import json
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Tuple, List
 from typing import Dict, Tuple, List, Optional
@@ -47,6 +49,9 @@ YELLOW = "\033[33m"  # everyone else
 
 DBG = False
 
+# Per-trial metrics from earlier runs, keyed by the trial's newest archive
+CACHE_NAME = ".fuzzer_speeds_cache.json"
+
 # Result‑dict type alias
 TrialMap = Dict[int, Tuple[float, Optional[float]]]
 Results = Dict[str, Dict[str, Tuple[TrialMap, float, float]]]
@@ -85,6 +90,13 @@ def parse_args() -> argparse.Namespace:
         help="Include trial IDs next to speeds in the pretty-printed summary",
     )
 
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Worker processes for reading corpus archives (default: CPU count)",
+    )
 
     p.add_argument("--debug", action="store_true", help="Verbose prints for troubleshooting")
     return p.parse_args()
@@ -150,11 +162,8 @@ def _metrics_from_fuzzer_stats(stats: str) -> Tuple[float, Optional[float]]:
 
     return execs_per_sec, run_time_s
 
-def _trial_metrics(trial: Path) -> Optional[Tuple[float, Optional[float]]]:
-    """
-    Scan the latest corpus archive in a trial dir and return (execs_per_sec, run_time_s).
-    Returns None if no usable stats are found.
-    """
+def _trial_archives(trial: Path) -> List[Path]:
+    """Corpus archives of a trial dir, newest first."""
     corpus_dir = trial / "corpus"
 
     def archive_no(p: Path) -> int:
@@ -166,12 +175,20 @@ def _trial_metrics(trial: Path) -> Optional[Tuple[float, Optional[float]]]:
             if p.name.startswith("corpus-archive-") and p.name.endswith(".tar.gz")
         ]
     except FileNotFoundError:
-        return None
+        return []
+    return sorted(tar_archives, key=archive_no, reverse=True)
 
-    for t in sorted(tar_archives, key=archive_no, reverse=True):
+def _trial_metrics(trial: Path) -> Optional[Tuple[float, Optional[float]]]:
+    """
+    Scan the latest corpus archive in a trial dir and return (execs_per_sec, run_time_s).
+    Returns None if no usable stats are found.
+    """
+    for t in _trial_archives(trial):
         try:
             with tarfile.open(t, "r:gz", errorlevel=0) as tf:
-                for m in tf.getmembers():
+                # Iterate lazily: stop decompressing at the first match instead
+                # of reading the whole member table up front
+                for m in tf:
                     if m.name.endswith("fuzzer_stats"):
                         if DBG:
                             print(f"Found fuzzer_stats in {t}")
@@ -183,16 +200,66 @@ def _trial_metrics(trial: Path) -> Optional[Tuple[float, Optional[float]]]:
             continue
     return None
 
-def _experiment_results(base_dir: Path) -> Results:
-    """Return results dict parsed from *base_dir* (.experiment-folders)."""
+def _cache_key(trial: Path) -> Optional[Tuple[str, int]]:
+    """(newest archive path, its st_mtime_ns), or None if the trial has no archive."""
+    archives = _trial_archives(trial)
+    if not archives:
+        return None
+    try:
+        return str(archives[0]), archives[0].stat().st_mtime_ns
+    except OSError:
+        return None
+
+def _load_cache(path: Path) -> Dict[str, dict]:
+    try:
+        with path.open() as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+_CACHE_MISS = object()
+
+def _cached_metrics(cache: Dict[str, dict], key: Tuple[str, int]):
+    """Cached metrics for *key* (possibly None), or _CACHE_MISS if absent, stale or malformed."""
+    try:
+        entry = cache[key[0]]
+        if entry["mtime_ns"] != key[1]:
+            return _CACHE_MISS
+        met = entry["metrics"]
+        if met is None:
+            return None
+        speed, rt = met
+        return float(speed), (None if rt is None else float(rt))
+    except (KeyError, TypeError, ValueError):
+        # Hand-edited or corrupted entry: treat it like any other miss
+        return _CACHE_MISS
+
+def _save_cache(path: Path, cache: Dict[str, dict]) -> None:
+    # Best effort: a read-only experiment dir just means no cache
+    try:
+        with path.open("w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def _init_worker(debug: bool) -> None:
+    """Carry --debug into pool workers (not inherited under spawn)."""
+    global DBG
+    DBG = debug
+
+def _experiment_results(base_dir: Path, jobs: int = 1, cache_path: Optional[Path] = None) -> Results:
+    """
+    Return results dict parsed from *base_dir* (.experiment-folders).
+    If *cache_path* is given, per-trial metrics are reused from / saved to it.
+    """
 
     results: Results = defaultdict(dict)
 
+    # Collect every trial up front so archives from all folders share one pool
+    folders: List[Tuple[Path, List[Tuple[int, Path]]]] = []
     for folder in filter(Path.is_dir, base_dir.iterdir()):
-        fuzzer = folder.name.split("-")[-1]
-        benchmark = folder.name[: -(len(fuzzer) + 1)]
-
-        trial_map: TrialMap = {}
+        trials: List[Tuple[int, Path]] = []
         for p in folder.iterdir():
             if not p.is_dir():
                 continue
@@ -200,7 +267,48 @@ def _experiment_results(base_dir: Path) -> Results:
                 tid = _parse_trial_id(p)
             except Exception:
                 continue
-            met = _trial_metrics(p)
+            trials.append((tid, p))
+        folders.append((folder, trials))
+
+    # Trials whose newest archive is unchanged since the last run are not reopened
+    trial_dirs = [p for _, trials in folders for _, p in trials]
+    old_cache = _load_cache(cache_path) if cache_path is not None else {}
+    keys = [_cache_key(p) for p in trial_dirs]
+    metrics: List[Optional[Tuple[float, Optional[float]]]] = [None] * len(trial_dirs)
+    todo: List[int] = []
+    for i, key in enumerate(keys):
+        met = _cached_metrics(old_cache, key) if key is not None else _CACHE_MISS
+        if met is _CACHE_MISS:
+            todo.append(i)
+        else:
+            metrics[i] = met
+
+    # Decompressing the archives is CPU-bound and independent per trial
+    pending = [trial_dirs[i] for i in todo]
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(DBG,)) as ex:
+            fresh = list(ex.map(_trial_metrics, pending, chunksize=4))
+    else:
+        fresh = list(map(_trial_metrics, pending))
+    for i, met in zip(todo, fresh):
+        metrics[i] = met
+
+    new_cache = {
+        key[0]: {"mtime_ns": key[1], "metrics": list(met) if met is not None else None}
+        for key, met in zip(keys, metrics)
+        if key is not None
+    }
+    if cache_path is not None and new_cache != old_cache:
+        _save_cache(cache_path, new_cache)
+    metrics_iter = iter(metrics)
+
+    for folder, trials in folders:
+        fuzzer = folder.name.split("-")[-1]
+        benchmark = folder.name[: -(len(fuzzer) + 1)]
+
+        trial_map: TrialMap = {}
+        for tid, _ in trials:
+            met = next(metrics_iter)
             if met is None:
                 continue
             execs_per_sec, run_time_s = met
@@ -210,9 +318,9 @@ def _experiment_results(base_dir: Path) -> Results:
             print(f"{folder.name} has no data yet — skipping…")
             continue
 
-        speeds = [v[0] for v in trial_map.values()]
-        mean = statistics.mean(speeds)
-        stdev = statistics.stdev(speeds) if len(speeds) > 1 else 0.0
+        speeds = np.fromiter((v[0] for v in trial_map.values()), dtype=np.float64, count=len(trial_map))
+        mean = float(speeds.mean())
+        stdev = float(speeds.std(ddof=1)) if speeds.size > 1 else 0.0
         results[benchmark][fuzzer] = (trial_map, mean, stdev)
 
     return results
@@ -234,15 +342,16 @@ def write_csv(results: Results, out_path: Path) -> None:
         for benchmark in sorted(results):
             for fuzzer in sorted(results[benchmark]):
                 trial_map, mean, stdev = results[benchmark][fuzzer]
-                pairs = " ".join(
+                items = sorted(trial_map.items())
+                pairs = " ".join([
                     f"{tid}:{speed:.2f}"
-                    for tid, (speed, _rt) in sorted(trial_map.items())
-                )
-                time_pairs = " ".join(
+                    for tid, (speed, _rt) in items
+                ])
+                time_pairs = " ".join([
                     f"{tid}:{int(rt)}"  # seconds, integer for compactness
-                    for tid, (_speed, rt) in sorted(trial_map.items())
+                    for tid, (_speed, rt) in items
                     if rt is not None
-                )
+                ])
                 w.writerow(
                     [
                         benchmark,
@@ -356,12 +465,17 @@ def emit_chart(results: Results, out_path: Path, show: bool = False) -> None:
     means = np.full((len(benchmarks), len(fuzzers)), np.nan)
     stds = np.full_like(means, np.nan)
 
-    for bi, bench in enumerate(benchmarks):
-        for fi, fuzzer in enumerate(fuzzers):
-            if fuzzer in results[bench]:
-                _, mean, std = results[bench][fuzzer]
-                means[bi, fi] = mean
-                stds[bi, fi] = std
+    # One pass over the (benchmark, fuzzer) pairs present, then a single scatter
+    fuzzer_idx = {f: i for i, f in enumerate(fuzzers)}
+    cells = [
+        (bi, fuzzer_idx[fuzzer], mean, std)
+        for bi, bench in enumerate(benchmarks)
+        for fuzzer, (_, mean, std) in results[bench].items()
+    ]
+    if cells:
+        bi_idx, fi_idx, m_vals, s_vals = zip(*cells)
+        means[bi_idx, fi_idx] = m_vals
+        stds[bi_idx, fi_idx] = s_vals
 
     x = np.arange(len(benchmarks))
     width = 0.8 / len(fuzzers)
@@ -418,7 +532,7 @@ def main() -> None:
         if not base_dir.is_dir():
             sys.exit(f"Error: '{base_dir}' does not look like a FuzzBench data folder")
 
-        results = _experiment_results(base_dir)
+        results = _experiment_results(base_dir, max(1, args.jobs), exp_dir / CACHE_NAME)
         if not results:
             sys.exit("No valid trials found — nothing to do.")
 